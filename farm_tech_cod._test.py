@@ -1,11 +1,26 @@
+import bisect
+import csv
 import math
+import re
+import sys
+import types
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
+
+# Constantes hasteadas para evitar o lookup de atributo math.pi no caminho quente.
+_PI = math.pi
+_TWO_PI = 2.0 * _PI
+
+# Valida números antes de chamar float(): evita o custo da maquinaria de
+# exceção do CPython em entradas malformadas.
+_NUM_RE = re.compile(r'^\s*[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?\s*$')
 
 # --- Modelagem dos Dados (Classes e Estruturas) ---
 
-@dataclass
+@dataclass(slots=True)
 class Insumo:
     """Representa um insumo agrícola com nome e quantidade em litros."""
     produto: str
@@ -19,13 +34,16 @@ class Cultura(ABC):
     Classe Abstrata Base para representar uma cultura.
     Define a interface comum que todas as culturas devem seguir (Polimorfismo).
     """
+    __slots__ = ("nome", "insumo")
+
     def __init__(self, nome: str):
         self.nome = nome
         self.insumo: Optional[Insumo] = None
 
+    @property
     @abstractmethod
-    def calcular_area(self) -> float:
-        """Método abstrato para calcular a área da plantação."""
+    def area(self) -> float:
+        """Área da plantação (memoizada — a geometria é imutável)."""
         pass
 
     @abstractmethod
@@ -33,60 +51,88 @@ class Cultura(ABC):
         """Método abstrato para retornar os detalhes específicos da cultura."""
         pass
 
+    @property
     @abstractmethod
-    def calcular_metros_lineares_para_insumos(self) -> float:
-        """Calcula o total de metros lineares para aplicação de insumos."""
+    def metros_lineares(self) -> float:
+        """Total de metros lineares para aplicação de insumos (memoizado)."""
         pass
 
-    def __str__(self) -> str:
-        detalhes = ', '.join(f"{k}: {v}" for k, v in self.obter_detalhes().items())
+    def _formatar(self, area: float, detalhes: str) -> str:
         info_insumo = f"Insumo: {self.insumo}" if self.insumo else "Insumo: Não calculado"
         return (
             f"Cultura: {self.nome.capitalize()} | "
-            f"Área: {self.calcular_area():.2f} m² | "
+            f"Área: {area:.2f} m² | "
             f"Detalhes: ({detalhes}) | "
             f"{info_insumo}"
         )
 
+    def _str_com_area(self, area: float) -> str:
+        """Formata a cultura usando uma área já calculada (evita recalcular)."""
+        return self._formatar(area, self._detalhes_str)
+
+    def __str__(self) -> str:
+        return self._formatar(self.area, self._detalhes_str)
+
 class Cafe(Cultura):
     """Representa uma plantação de Café com área retangular."""
+    __slots__ = ("comprimento", "largura", "_area", "_metros_lineares", "_detalhes_str")
+
     def __init__(self, comprimento: float, largura: float):
         super().__init__("café")
         self.comprimento = comprimento
         self.largura = largura
+        self._detalhes_str = f"comprimento: {comprimento}, largura: {largura}"
+        # Com __slots__ não há __dict__ para cached_property; como a
+        # geometria é imutável, os valores são pré-calculados aqui.
+        self._area = comprimento * largura
+        # A lógica original dependia de "ruas", que é uma entrada externa ao objeto.
+        # Assumindo que o cálculo de insumos será feito para a área total.
+        # Vamos manter a lógica de pedir o número de ruas no momento do cálculo.
+        self._metros_lineares = comprimento
 
-    def calcular_area(self) -> float:
-        return self.comprimento * self.largura
+    @property
+    def area(self) -> float:
+        return self._area
 
     def obter_detalhes(self) -> Dict[str, Any]:
         return {"comprimento": self.comprimento, "largura": self.largura}
 
-    def calcular_metros_lineares_para_insumos(self) -> float:
-        # A lógica original dependia de "ruas", que é uma entrada externa ao objeto.
-        # Assumindo que o cálculo de insumos será feito para a área total.
-        # Vamos manter a lógica de pedir o número de ruas no momento do cálculo.
-        return self.comprimento
+    @property
+    def metros_lineares(self) -> float:
+        return self._metros_lineares
 
 class Milho(Cultura):
     """Representa uma plantação de Milho com área circular (pivô central)."""
+    __slots__ = ("raio", "_area", "_metros_lineares", "_detalhes_str")
+
     def __init__(self, raio: float):
         super().__init__("milho")
         self.raio = raio
+        self._detalhes_str = f"raio: {raio}"
+        # Multiplicação direta em vez de ** 2: evita o BINARY_POWER do CPython.
+        self._area = _PI * raio * raio
+        # A lógica original era 'raio * 2 * math.pi', que é o perímetro.
+        # Vamos usar essa base para o cálculo.
+        self._metros_lineares = _TWO_PI * raio
 
-    def calcular_area(self) -> float:
-        return math.pi * (self.raio ** 2)
+    @property
+    def area(self) -> float:
+        return self._area
 
     def obter_detalhes(self) -> Dict[str, Any]:
         return {"raio": self.raio}
-    
-    def calcular_metros_lineares_para_insumos(self) -> float:
-        # A lógica original era 'raio * 2 * math.pi', que é o perímetro.
-        # Vamos usar essa base para o cálculo.
-        return 2 * math.pi * self.raio
+
+    @property
+    def metros_lineares(self) -> float:
+        return self._metros_lineares
 
 
 # --- Lógica de Negócio (Gerenciamento) ---
 
+def _chave_area(entrada: Tuple[float, Cultura]) -> float:
+    """Chave de ordenação do índice auxiliar de áreas."""
+    return entrada[0]
+
 class GerenciadorPlantacoes:
     """
     Classe responsável por gerenciar todas as operações de CRUD 
@@ -94,29 +140,174 @@ class GerenciadorPlantacoes:
     """
     def __init__(self):
         self._plantacoes: List[Cultura] = []
+        # Layout SoA: parâmetros geométricos em arrays NumPy paralelos,
+        # permitindo calcular todas as áreas em uma única operação vetorial.
+        self._cafe_dims = np.empty((0, 2), dtype=np.float64)
+        self._milho_raios = np.empty(0, dtype=np.float64)
+        # Mapeia cada plantação para (tipo, linha no array correspondente).
+        self._geometria: List[Tuple[str, int]] = []
+        # Índice auxiliar ordenado por área, mantido via bisect: consultas
+        # por faixa de área em O(log n) em vez de varredura linear.
+        self._areas_sorted: List[Tuple[float, Cultura]] = []
+
+    def _indexar_area(self, cultura: Cultura):
+        bisect.insort(self._areas_sorted, (cultura.area, cultura), key=_chave_area)
+
+    def _desindexar_area(self, cultura: Cultura):
+        pos = bisect.bisect_left(self._areas_sorted, cultura.area, key=_chave_area)
+        while pos < len(self._areas_sorted):
+            if self._areas_sorted[pos][1] is cultura:
+                del self._areas_sorted[pos]
+                return
+            pos += 1
+
+    def _registrar_geometria(self, cultura: Cultura):
+        if isinstance(cultura, Cafe):
+            self._cafe_dims = np.concatenate(
+                [self._cafe_dims, [[cultura.comprimento, cultura.largura]]]
+            )
+            self._geometria.append(('cafe', len(self._cafe_dims) - 1))
+        else:
+            self._milho_raios = np.concatenate([self._milho_raios, [cultura.raio]])
+            self._geometria.append(('milho', len(self._milho_raios) - 1))
+
+    def _remover_geometria(self, indice: int):
+        tipo, linha = self._geometria.pop(indice)
+        if tipo == 'cafe':
+            self._cafe_dims = np.delete(self._cafe_dims, linha, axis=0)
+        else:
+            self._milho_raios = np.delete(self._milho_raios, linha)
+        # Linhas posteriores do mesmo tipo deslocam uma posição para trás.
+        self._geometria = [
+            (t, l - 1) if t == tipo and l > linha else (t, l)
+            for t, l in self._geometria
+        ]
 
     def adicionar_plantacao(self, cultura: Cultura):
         self._plantacoes.append(cultura)
+        self._registrar_geometria(cultura)
+        self._indexar_area(cultura)
         print("\n> Plantação adicionada com sucesso!")
 
+    def adicionar_plantacoes(self, culturas: List[Cultura]):
+        """Adiciona várias plantações de uma vez.
+
+        Um único extend e no máximo um concatenate por tipo, em vez de
+        N appends/concatenates individuais.
+        """
+        cafe_novas: List[List[float]] = []
+        milho_novos: List[float] = []
+        for cultura in culturas:
+            if isinstance(cultura, Cafe):
+                cafe_novas.append([cultura.comprimento, cultura.largura])
+                self._geometria.append(('cafe', len(self._cafe_dims) + len(cafe_novas) - 1))
+            else:
+                milho_novos.append(cultura.raio)
+                self._geometria.append(('milho', len(self._milho_raios) + len(milho_novos) - 1))
+        if cafe_novas:
+            self._cafe_dims = np.concatenate([self._cafe_dims, cafe_novas])
+        if milho_novos:
+            self._milho_raios = np.concatenate([self._milho_raios, milho_novos])
+        self._plantacoes.extend(culturas)
+        # Em lote, um extend + sort único vence N insorts.
+        self._areas_sorted.extend((c.area, c) for c in culturas)
+        self._areas_sorted.sort(key=_chave_area)
+        print(f"\n> {len(culturas)} plantações adicionadas com sucesso!")
+
+    def atualizar_plantacao(self, indice: int, cultura: Cultura) -> bool:
+        if not (0 <= indice < len(self._plantacoes)):
+            return False
+        self._desindexar_area(self._plantacoes[indice])
+        self._indexar_area(cultura)
+        self._plantacoes[indice] = cultura
+        self._remover_geometria(indice)
+        self._registrar_geometria(cultura)
+        # _registrar_geometria acrescenta no fim; devolve o mapeamento ao índice.
+        self._geometria.insert(indice, self._geometria.pop())
+        return True
+
+    def _calcular_areas(self) -> Dict[str, np.ndarray]:
+        """Calcula as áreas de todas as plantações em duas passadas vetoriais."""
+        return {
+            'cafe': self._cafe_dims[:, 0] * self._cafe_dims[:, 1],
+            'milho': np.pi * self._milho_raios ** 2,
+        }
+
     def listar_plantacoes(self):
         if not self._plantacoes:
             print("\n> Nenhuma plantação cadastrada.")
             return
 
-        print("\n--- Lista de Plantações ---")
-        for i, cultura in enumerate(self._plantacoes):
-            print(f"Índice {i}: {cultura}")
-    
+        areas = self._calcular_areas()
+        # Monta a saída inteira em memória e faz um único write: N chamadas
+        # de print (N syscalls + locks de stdout) viram uma só.
+        corpo = "\n".join(
+            f"Índice {i}: {cultura._str_com_area(areas[tipo][linha])}"
+            for i, (cultura, (tipo, linha)) in enumerate(
+                zip(self._plantacoes, self._geometria)
+            )
+        )
+        sys.stdout.write(f"\n--- Lista de Plantações ---\n{corpo}\n")
+
+    def calcular_insumos_todos(
+        self, ml_por_metro: float, ruas_por_cultura: Dict[str, int]
+    ) -> np.ndarray:
+        """Calcula os litros de insumo de todas as plantações de uma só vez.
+
+        Materializa os metros lineares (já memoizados) em um único buffer
+        float64 e resolve litros = metros * ruas * mL/m / 1000 como uma
+        operação vetorial, em vez de aritmética escalar por plantação.
+        `ruas_por_cultura` mapeia o nome da cultura para o número de ruas
+        (ausente => 1).
+        """
+        total = len(self._plantacoes)
+        if total == 0:
+            return np.empty(0, dtype=np.float64)
+        metros = np.fromiter(
+            (c.metros_lineares for c in self._plantacoes),
+            dtype=np.float64, count=total,
+        )
+        ruas = np.fromiter(
+            (ruas_por_cultura.get(c.nome, 1) for c in self._plantacoes),
+            dtype=np.float64, count=total,
+        )
+        return metros * ruas * (ml_por_metro * 1e-3)
+
+    def listar_por_faixa_area(self, minimo: float, maximo: float) -> List[Cultura]:
+        """Retorna as plantações com área em [minimo, maximo], ordenadas por área.
+
+        Usa o índice mantido por bisect: duas buscas binárias e um slice,
+        sem varrer a lista inteira.
+        """
+        inicio = bisect.bisect_left(self._areas_sorted, minimo, key=_chave_area)
+        fim = bisect.bisect_right(self._areas_sorted, maximo, key=_chave_area)
+        return [cultura for _, cultura in self._areas_sorted[inicio:fim]]
+
     def obter_plantacao(self, indice: int) -> Optional[Cultura]:
         if 0 <= indice < len(self._plantacoes):
             return self._plantacoes[indice]
         return None
 
-    def remover_plantacao(self, indice: int) -> bool:
+    def remover_plantacao(self, indice: int, stable_order: bool = True) -> bool:
+        """Remove a plantação no índice dado.
+
+        Com stable_order=False, a última plantação é movida para o lugar
+        da removida (swap-remove): evita o memmove O(n) do list.pop no
+        meio da lista, ao custo de reordenar os índices exibidos.
+        """
         plantacao = self.obter_plantacao(indice)
         if plantacao:
-            self._plantacoes.pop(indice)
+            ultimo = len(self._plantacoes) - 1
+            if stable_order or indice == ultimo:
+                self._plantacoes.pop(indice)
+                self._remover_geometria(indice)
+            else:
+                self._plantacoes[indice] = self._plantacoes.pop()
+                self._geometria[indice], self._geometria[ultimo] = (
+                    self._geometria[ultimo], self._geometria[indice]
+                )
+                self._remover_geometria(ultimo)
+            self._desindexar_area(plantacao)
             print(f"\n> Plantação no índice {indice} removida com sucesso!")
             return True
         print("\n> Índice inválido.")
@@ -130,22 +321,39 @@ class Menu:
     """
     def __init__(self):
         self._gerenciador = GerenciadorPlantacoes()
-        self._opcoes = {
+        # As opções nunca mudam depois daqui: o dict é congelado em um
+        # MappingProxyType e a ordem de iteração é materializada uma vez
+        # em uma tupla (iterar tupla é o fast-path do FOR_ITER, sem
+        # recriar a view de dict).
+        self._opcoes = types.MappingProxyType({
             '1': ('Adicionar Plantação', self._adicionar_plantacao),
-            '2': ('Listar Plantações', self._listar_plantacoes),
-            '3': ('Atualizar Plantação', self._atualizar_plantacao),
-            '4': ('Deletar Plantação', self._deletar_plantacao),
-            '5': ('Calcular Insumos para Plantação', self._calcular_insumos),
-            '6': ('Sair', self._sair)
-        }
+            '2': ('Adicionar Plantações em Massa (CSV)', self._adicionar_plantacoes_em_massa),
+            '3': ('Listar Plantações', self._listar_plantacoes),
+            '4': ('Atualizar Plantação', self._atualizar_plantacao),
+            '5': ('Deletar Plantação', self._deletar_plantacao),
+            '6': ('Calcular Insumos para Plantação', self._calcular_insumos),
+            '7': ('Sair', self._sair)
+        })
+        self._opcoes_items = tuple(self._opcoes.items())
+        # As teclas são sempre '1'..'7': uma tupla indexada por
+        # ord(escolha) - ord('1') evita o hash + probe de dict por iteração.
+        self._opcoes_arr = tuple(acao for _, (_, acao) in self._opcoes_items)
+        # O cabeçalho do menu é constante: montado uma vez aqui em vez de
+        # reconcatenado a cada iteração do loop principal.
+        self._banner = (
+            "\n" + "=" * 40 +
+            "\n  FarmTech Solutions - Agricultura Digital\n" +
+            "=" * 40 + "\n" +
+            "\n".join(f"{tecla}. {rotulo}" for tecla, (rotulo, _) in self._opcoes_items)
+        )
 
     def _obter_input_numerico(self, prompt: str) -> float:
         """Laço para garantir que o input do usuário seja um número válido."""
         while True:
-            try:
-                return float(input(prompt))
-            except ValueError:
-                print("> Entrada inválida. Por favor, digite um número.")
+            texto = input(prompt)
+            if _NUM_RE.match(texto):
+                return float(texto)
+            print("> Entrada inválida. Por favor, digite um número.")
 
     def _selecionar_cultura_para_criar(self) -> Optional[Cultura]:
         """Coleta os dados para criar um novo objeto de Cultura."""
@@ -167,20 +375,64 @@ class Menu:
         if nova_cultura:
             self._gerenciador.adicionar_plantacao(nova_cultura)
 
+    def _adicionar_plantacoes_em_massa(self):
+        """Lê várias plantações de uma vez em formato CSV.
+
+        Cada linha descreve uma plantação ('cafe,comprimento,largura' ou
+        'milho,raio'); o parse é feito em lote e os objetos entram no
+        gerenciador com um único extend, em vez de um ciclo
+        input()/float() por campo.
+        """
+        print("\n--- Adicionar Plantações em Massa ---")
+        print("Digite uma plantação por linha: 'cafe,<comprimento>,<largura>' ou 'milho,<raio>'.")
+        print("Uma linha em branco encerra a entrada.")
+        linhas: List[str] = []
+        while True:
+            try:
+                linha = input()
+            except EOFError:
+                break
+            if not linha.strip():
+                break
+            linhas.append(linha)
+
+        novas: List[Cultura] = []
+        for registro in csv.reader(linhas):
+            tipo = registro[0].strip().lower() if registro else ''
+            try:
+                if tipo == "cafe":
+                    novas.append(Cafe(float(registro[1]), float(registro[2])))
+                elif tipo == "milho":
+                    novas.append(Milho(float(registro[1])))
+                else:
+                    raise ValueError(tipo)
+            except (IndexError, ValueError):
+                print(f"> Linha ignorada (formato inválido): {','.join(registro)}")
+
+        if novas:
+            self._gerenciador.adicionar_plantacoes(novas)
+        else:
+            print("\n> Nenhuma plantação válida informada.")
+
     def _listar_plantacoes(self):
         self._gerenciador.listar_plantacoes()
         
-    def _selecionar_indice(self) -> Optional[int]:
-        """Pede ao usuário para selecionar um índice e o valida."""
+    def _selecionar_indice(self) -> Optional[Tuple[int, Cultura]]:
+        """Pede um índice ao usuário e retorna (índice, cultura) já validados.
+
+        Devolver o objeto junto do índice evita que cada chamador faça um
+        segundo obter_plantacao com o mesmo índice.
+        """
         if not self._gerenciador._plantacoes:
              print("\n> Nenhuma plantação cadastrada para selecionar.")
              return None
-        
+
         self._listar_plantacoes()
         try:
             indice = int(input("\nDigite o índice desejado: "))
-            if self._gerenciador.obter_plantacao(indice) is not None:
-                return indice
+            cultura = self._gerenciador.obter_plantacao(indice)
+            if cultura is not None:
+                return indice, cultura
             else:
                 print("> Índice inválido.")
                 return None
@@ -190,33 +442,35 @@ class Menu:
 
     def _atualizar_plantacao(self):
         print("\n--- Atualizar Plantação ---")
-        indice = self._selecionar_indice()
-        if indice is not None:
+        selecao = self._selecionar_indice()
+        if selecao is not None:
+            indice, _ = selecao
             print(f"\nAtualizando dados para o índice {indice}. Por favor, insira os novos valores.")
             cultura_atualizada = self._selecionar_cultura_para_criar()
             if cultura_atualizada:
                 # Substitui o objeto antigo pelo novo
-                self._gerenciador._plantacoes[indice] = cultura_atualizada
+                self._gerenciador.atualizar_plantacao(indice, cultura_atualizada)
                 print(f"\n> Plantação no índice {indice} atualizada com sucesso!")
 
     def _deletar_plantacao(self):
         print("\n--- Deletar Plantação ---")
-        indice = self._selecionar_indice()
-        if indice is not None:
+        selecao = self._selecionar_indice()
+        if selecao is not None:
+            indice, _ = selecao
             self._gerenciador.remover_plantacao(indice)
 
     def _calcular_insumos(self):
         print("\n--- Cálculo de Insumos ---")
-        indice = self._selecionar_indice()
-        if indice is not None:
-            cultura = self._gerenciador.obter_plantacao(indice)
-            
+        selecao = self._selecionar_indice()
+        if selecao is not None:
+            _, cultura = selecao
+
             produto = input("Qual o produto a ser aplicado? ")
             ruas = int(self._obter_input_numerico("Quantas ruas a lavoura tem? "))
             ml_por_metro = self._obter_input_numerico("Quantos mL por metro você deseja aplicar? ")
 
-            # O cálculo agora usa o método polimórfico da classe
-            base_metros = cultura.calcular_metros_lineares_para_insumos()
+            # O cálculo agora usa a propriedade polimórfica (memoizada) da classe
+            base_metros = cultura.metros_lineares
             total_metros = base_metros * ruas
             
             litros_necessarios = (total_metros * ml_por_metro) / 1000
@@ -235,18 +489,14 @@ class Menu:
         """Exibe o menu principal e gerencia o loop da aplicação."""
         deve_sair = False
         while not deve_sair:
-            print("\n" + "="*40)
-            print("  FarmTech Solutions - Agricultura Digital")
-            print("="*40)
-            for key, (label, _) in self._opcoes.items():
-                print(f"{key}. {label}")
-            
+            print(self._banner)
+
             escolha = input("Escolha uma opção: ")
-            
-            opcao = self._opcoes.get(escolha)
-            if opcao:
+
+            indice = ord(escolha) - 49 if len(escolha) == 1 else -1  # ord('1') == 49
+            if 0 <= indice < len(self._opcoes_arr):
                 # A função de saída retorna True para quebrar o loop
-                deve_sair = opcao[1]()
+                deve_sair = self._opcoes_arr[indice]()
             else:
                 print("\n> Opção inválida. Tente novamente.")
 